@@ -3,8 +3,8 @@ Reddit Post Data Model
 Defines the structure and validation for Reddit posts
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, MISSING
+from typing import Optional, List, Dict, Any, Iterable
 from datetime import datetime
 import json
 
@@ -57,10 +57,27 @@ class RedditPost:
     def from_dict(cls, data: Dict[str, Any]) -> 'RedditPost':
         """Create a RedditPost from a dictionary"""
         # Filter out any keys that aren't in our dataclass
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+        filtered_data = {k: v for k, v in data.items() if k in _POST_FIELDS}
         return cls(**filtered_data)
 
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> 'RedditPost':
+        """
+        Create a RedditPost from a dictionary produced by reddit_service
+
+        Skips __init__ and fills the instance dict directly. Unknown keys
+        are still dropped and missing optional fields get their defaults,
+        but required fields are not checked - use from_dict() for data
+        from anywhere else.
+        """
+        attrs = {**_POST_DEFAULTS, **data}
+        for key in attrs.keys() - _POST_FIELDS:
+            del attrs[key]
+
+        post = object.__new__(cls)
+        post.__dict__ = attrs
+        return post
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert RedditPost to dictionary"""
         return {
@@ -147,11 +164,27 @@ class RedditPost:
                 f"comments={self.num_comments})")
 
 
+# Field names and defaults, resolved once for the dict constructors above
+_POST_FIELDS = frozenset(RedditPost.__dataclass_fields__)
+_POST_DEFAULTS = {
+    name: f.default
+    for name, f in RedditPost.__dataclass_fields__.items()
+    if f.default is not MISSING
+}
+
+
 class PostCollection:
     """Collection of Reddit posts with utility methods"""
 
-    def __init__(self, posts: List[RedditPost] = None):
-        self.posts = posts or []
+    def __init__(self, posts: Iterable[RedditPost] = None):
+        # Lists are kept as-is; any other iterable (e.g. a generator) is
+        # materialized once here
+        if posts is None:
+            self.posts = []
+        elif isinstance(posts, list):
+            self.posts = posts
+        else:
+            self.posts = list(posts)
 
     def add_post(self, post: RedditPost):
         """Add a post to the collection"""
@@ -202,19 +235,34 @@ class PostCollection:
                 }
             }
 
+        # One pass over the posts, accumulating every counter at once
+        subreddits = set()
+        with_text = score_sum = comment_sum = nsfw_count = spoiler_count = 0
+        status_counts = {"pending": 0, "processed": 0, "failed": 0}
+
+        for p in self.posts:
+            subreddits.add(p.subreddit)
+            if p.has_text_content:
+                with_text += 1
+            score_sum += p.score
+            comment_sum += p.num_comments
+            if p.over_18:
+                nsfw_count += 1
+            if p.spoiler:
+                spoiler_count += 1
+            if p.processing_status in status_counts:
+                status_counts[p.processing_status] += 1
+
+        total = len(self.posts)
         return {
-            "total": len(self.posts),
-            "subreddits": list(set(p.subreddit for p in self.posts)),
-            "with_text": sum(1 for p in self.posts if p.has_text_content),
-            "avg_score": sum(p.score for p in self.posts) / len(self.posts),
-            "avg_comments": sum(p.num_comments for p in self.posts) / len(self.posts),
-            "nsfw_count": sum(1 for p in self.posts if p.over_18),
-            "spoiler_count": sum(1 for p in self.posts if p.spoiler),
-            "processing_status": {
-                "pending": sum(1 for p in self.posts if p.processing_status == "pending"),
-                "processed": sum(1 for p in self.posts if p.processing_status == "processed"),
-                "failed": sum(1 for p in self.posts if p.processing_status == "failed")
-            }
+            "total": total,
+            "subreddits": list(subreddits),
+            "with_text": with_text,
+            "avg_score": score_sum / total,
+            "avg_comments": comment_sum / total,
+            "nsfw_count": nsfw_count,
+            "spoiler_count": spoiler_count,
+            "processing_status": status_counts
         }
 
     def to_json(self) -> str:
@@ -5,8 +5,10 @@ Manages audio generation from processed Reddit posts
 
 import os
 import json
+import queue
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 import hashlib
 
@@ -45,6 +47,8 @@ class AudioGenerator:
         # Metadata storage
         self.metadata_file = self.audio_dir / 'audio_metadata.json'
         self.metadata = self._load_metadata()
+        # Guards metadata updates when posts are generated from worker threads
+        self._metadata_lock = threading.Lock()
 
         logger.info(f"Audio generator initialized with {engine_type} engine")
 
@@ -54,7 +58,8 @@ class AudioGenerator:
         voice: Optional[str] = None,
         speed: float = 1.0,
         language: Optional[str] = None,
-        force_regenerate: bool = False
+        force_regenerate: bool = False,
+        skip_unchanged: bool = False
     ) -> Dict[str, Any]:
         """
         Generate audio from a single Reddit post
@@ -71,6 +76,8 @@ class AudioGenerator:
             language: Optional language override (e.g., 'en', 'es', 'fr')
                       Overrides the language from voice setting
             force_regenerate: Regenerate even if audio exists
+            skip_unchanged: With force_regenerate, still reuse existing audio
+                            made from the same TTS text at the same settings
 
         Returns:
             Audio generation result
@@ -84,7 +91,7 @@ class AudioGenerator:
         # Check if audio already exists
         if not force_regenerate and self._audio_exists(post_id):
             logger.info(f"Audio already exists for post {post_id}")
-            return self.metadata.get(post_id, {})
+            return self.metadata.get(post_id, {}).copy()
 
         logger.info(
             f"Generating audio for post {post_id}: {post.get('title', '')[:50]}...")
@@ -95,6 +102,15 @@ class AudioGenerator:
         # Step 2: Filter content
         filtered_post = self.content_filter.filter_post(processed_post)
 
+        # Check if safe for TTS before spending any more work on the text
+        if not self.content_filter.is_safe_for_tts(filtered_post):
+            logger.warning(f"Post {post_id} not safe for TTS")
+            return {
+                'post_id': post_id,
+                'success': False,
+                'reason': 'Content filtered as unsafe'
+            }
+
         # Step 3: Preprocess for TTS
         tts_text = self.tts_preprocessor.preprocess_for_tts(
             filtered_post.get('tts_text', ''),
@@ -106,14 +122,10 @@ class AudioGenerator:
         tts_text = re.sub(r'<[^>]+>', '', tts_text)  # Strip all XML/SSML tags
         tts_text = re.sub(r'\s+', ' ', tts_text)  # Clean up extra spaces
 
-        # Check if safe for TTS
-        if not self.content_filter.is_safe_for_tts(filtered_post):
-            logger.warning(f"Post {post_id} not safe for TTS")
-            return {
-                'post_id': post_id,
-                'success': False,
-                'reason': 'Content filtered as unsafe'
-            }
+        if skip_unchanged and self._audio_matches(post_id, tts_text, voice, speed, language):
+            logger.info(f"Audio for post {post_id} is up to date")
+            # Copy so callers annotating the result don't edit stored metadata
+            return self.metadata[post_id].copy()
 
         # Step 4: Generate filename
         filename = self._generate_filename(post, filtered_post)
@@ -210,6 +222,75 @@ class AudioGenerator:
 
         return results
 
+    def generate_stream(
+        self,
+        posts: List[Dict[str, Any]],
+        voice: Optional[str] = None,
+        speed: float = 1.0,
+        language: Optional[str] = None,
+        force_regenerate: bool = False,
+        skip_unchanged: bool = False,
+        prefetch: int = 2
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate audio for multiple posts, yielding each result when ready
+
+        A background thread synthesizes up to ``prefetch`` posts ahead of the
+        caller, so work done on one result overlaps with the next TTS request.
+
+        Args:
+            posts: List of Reddit posts
+            voice: Voice ID to use for all posts
+            speed: Speech rate multiplier
+            language: Optional language override
+            force_regenerate: Regenerate even if audio exists
+            skip_unchanged: Reuse existing audio whose TTS text is unchanged
+            prefetch: Maximum number of finished results buffered ahead
+
+        Yields:
+            Generation result for each post, in input order
+        """
+        results: queue.Queue = queue.Queue(maxsize=prefetch)
+        done = object()
+        # Set when the caller stops iterating early, so the producer stops
+        # synthesizing and doesn't block forever on a full queue
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for post in posts:
+                    if stop.is_set():
+                        return
+                    if not put(self.generate_from_post(
+                            post, voice, speed, language, force_regenerate, skip_unchanged)):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        threading.Thread(target=produce, name='audio-generate-stream', daemon=True).start()
+
+        try:
+            while True:
+                result = results.get()
+                if result is done:
+                    return
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        finally:
+            stop.set()
+
     def _generate_filename(self, post: Dict, processed_post: Dict) -> str:
         """Generate filename for audio file"""
         # Use subreddit, truncated title, and timestamp
@@ -237,6 +318,20 @@ class AudioGenerator:
                 return True
         return False
 
+    def _audio_matches(self, post_id: str, tts_text: str, voice: Optional[str],
+                       speed: float, language: Optional[str] = None) -> bool:
+        """Check if existing audio was generated from this exact TTS text and settings"""
+        if not self._audio_exists(post_id):
+            return False
+        existing = self.metadata[post_id]
+        # Defaults are resolved first, so a default request doesn't match
+        # audio rendered with an explicit (different) voice or language
+        voice, language = self.engine.resolve_voice_settings(voice, language)
+        return (existing.get('text_hash') == self._hash_text(tts_text)
+                and existing.get('speed', 1.0) == speed
+                and existing.get('voice') == voice
+                and existing.get('language') == language)
+
     def _hash_text(self, text: str) -> str:
         """Generate hash of text for deduplication"""
         return hashlib.md5(text.encode()).hexdigest()[:8]
@@ -253,12 +348,13 @@ class AudioGenerator:
 
     def _save_audio_metadata(self, post_id: str, metadata: Dict):
         """Save audio metadata"""
-        self.metadata[post_id] = metadata
-        try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving metadata: {e}")
+        with self._metadata_lock:
+            self.metadata[post_id] = metadata
+            try:
+                with open(self.metadata_file, 'w') as f:
+                    json.dump(self.metadata, f, indent=2)
+            except Exception as e:
+                logger.error(f"Error saving metadata: {e}")
 
     def get_audio_stats(self) -> Dict:
         """Get statistics about generated audio"""
@@ -113,8 +113,8 @@ class AudioManager:
 
     def get_audio_by_subreddit(self, subreddit: str) -> List[Dict[str, Any]]:
         """Get all audio files for a subreddit"""
-        # RELOAD metadata from file
-        self.metadata = self._load_metadata()
+        # Pick up metadata written since the last call
+        self._refresh_metadata()
 
         audio_files = []
 
@@ -131,8 +131,8 @@ class AudioManager:
 
     def get_recent_audio(self, hours: int = 24, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get recently generated audio files"""
-        # RELOAD metadata from file to get fresh data
-        self.metadata = self._load_metadata()
+        # Pick up metadata written since the last call
+        self._refresh_metadata()
 
         cutoff = datetime.now() - timedelta(hours=hours)
         recent_files = []
@@ -290,9 +290,23 @@ class AudioManager:
         logger.info(f"Exported metadata to {output_path}")
         return str(output_path)
 
+    def _refresh_metadata(self):
+        """Reload metadata only if the file changed since it was last read"""
+        if self._metadata_stamp() != self._loaded_stamp:
+            self.metadata = self._load_metadata()
+
+    def _metadata_stamp(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the metadata file, or None if it is missing"""
+        try:
+            stat = os.stat(self.metadata_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def _load_metadata(self) -> Dict:
         """Load metadata from file"""
-        if self.metadata_file.exists():
+        self._loaded_stamp = self._metadata_stamp()
+        if self._loaded_stamp is not None:
             try:
                 with open(self.metadata_file, 'r') as f:
                     return json.load(f)
@@ -4,6 +4,7 @@ Manages queue of posts to be converted to audio
 """
 
 import json
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -33,6 +34,8 @@ class AudioQueue:
         """Initialize audio queue"""
         self.queue_file = Path(config.DATA_DIR) / 'audio_queue.json'
         self.queue = self._load_queue()
+        # Re-entrant: add_post() holds it while calling _save_queue()
+        self._lock = threading.RLock()
         self.audio_generator = None  # Lazy load
         self.reddit_client = None  # Lazy load
         
@@ -49,10 +52,47 @@ class AudioQueue:
         Returns:
             Queue item ID
         """
-        queue_id = f"{post.get('id', 'unknown')}_{int(time.time())}"
+        queue_item = self._build_queue_item(post, priority)
+        queue_id = queue_item['id']
         
-        queue_item = {
-            'id': queue_id,
+        with self._lock:
+            self.queue[queue_id] = queue_item
+            self._save_queue()
+        
+        logger.info(f"Added post {post.get('id')} to queue with priority {priority}")
+        return queue_id
+    
+    def add_posts_bulk(self, posts: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add many posts to the queue with a single save
+        
+        Priority follows post score (score // 100, clamped to 1-10), the
+        same rule add_subreddit_posts uses.
+        
+        Args:
+            posts: Reddit post dictionaries
+            
+        Returns:
+            List of queue IDs
+        """
+        items = [
+            self._build_queue_item(post, post.get('score', 0) // 100)
+            for post in posts
+        ]
+        
+        if items:
+            with self._lock:
+                for item in items:
+                    self.queue[item['id']] = item
+                self._save_queue()
+        
+        logger.info(f"Added {len(items)} posts to queue in bulk")
+        return [item['id'] for item in items]
+    
+    def _build_queue_item(self, post: Dict[str, Any], priority: int) -> Dict[str, Any]:
+        """Create a pending queue entry for a post"""
+        return {
+            'id': f"{post.get('id', 'unknown')}_{int(time.time())}",
             'post_id': post.get('id'),
             'post_data': post,
             'priority': max(1, min(10, priority)),  # Clamp to 1-10
@@ -63,12 +103,6 @@ class AudioQueue:
             'error': None,
             'result': None
         }
-        
-        self.queue[queue_id] = queue_item
-        self._save_queue()
-        
-        logger.info(f"Added post {post.get('id')} to queue with priority {priority}")
-        return queue_id
     
     async def add_subreddit_posts(
         self,
@@ -92,18 +126,12 @@ class AudioQueue:
         if not self.reddit_client:
             self.reddit_client = await get_reddit_client()
 
-        queue_ids = []
-
         # Fetch posts
         posts = await self.reddit_client.fetch_subreddit_posts(subreddit, sort_type, limit)
         
-        for post in posts:
-            # Filter by score
-            if post.get('score', 0) >= min_score:
-                # Higher score = higher priority
-                priority = min(10, max(1, post.get('score', 0) // 100))
-                queue_id = self.add_post(post, priority)
-                queue_ids.append(queue_id)
+        # Filter by score; higher score = higher priority
+        queue_ids = self.add_posts_bulk(
+            [post for post in posts if post.get('score', 0) >= min_score])
         
         logger.info(f"Added {len(queue_ids)} posts from r/{subreddit} to queue")
         return queue_ids
@@ -315,11 +343,12 @@ class AudioQueue:
     
     def _save_queue(self):
         """Save queue to file"""
-        try:
-            with open(self.queue_file, 'w') as f:
-                json.dump(self.queue, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving queue: {e}")
+        with self._lock:
+            try:
+                with open(self.queue_file, 'w') as f:
+                    json.dump(self.queue, f, indent=2)
+            except Exception as e:
+                logger.error(f"Error saving queue: {e}")
 
 
 # Singleton instance
@@ -4,6 +4,7 @@ Handles all interactions with Reddit API using Async PRAW
 """
 
 import asyncpraw
+import time
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 
@@ -14,6 +15,24 @@ from src.models.post_filter_config import PostFilterConfig
 # Create logger for this module
 logger = get_logger(__name__)
 
+# validate_subreddit results keyed by lower-cased name, as
+# (result, monotonic timestamp). Only definitive answers (found / not found /
+# private) are stored, never transient errors. Entries expire after
+# _VALID_CACHE_TTL seconds so a sub that changes state is re-checked, and the
+# oldest entries are dropped beyond _VALID_CACHE_MAX since names can come
+# straight from API query strings.
+_VALID_CACHE: Dict[str, Tuple[bool, float]] = {}
+_VALID_CACHE_TTL = 600
+_VALID_CACHE_MAX = 1024
+
+
+def _cache_validation(key: str, result: bool):
+    """Store a validate_subreddit result, evicting the oldest entries past the cap"""
+    _VALID_CACHE.pop(key, None)
+    _VALID_CACHE[key] = (result, time.monotonic())
+    while len(_VALID_CACHE) > _VALID_CACHE_MAX:
+        del _VALID_CACHE[next(iter(_VALID_CACHE))]
+
 
 class AsyncRedditClient:
     """Async Reddit API client wrapper"""
@@ -36,21 +55,36 @@ class AsyncRedditClient:
         """Close the async Reddit client connection"""
         await self.reddit.close()
 
+    def clear_subreddit_cache(self):
+        """Forget cached validate_subreddit results so the next check hits Reddit"""
+        _VALID_CACHE.clear()
+
     async def validate_subreddit(self, subreddit_name: str) -> bool:
         """
         Check if a subreddit exists and is accessible
 
+        Results are cached per subreddit for _VALID_CACHE_TTL seconds;
+        see clear_subreddit_cache().
+
         Args:
             subreddit_name: Name of the subreddit (without r/)
 
         Returns:
             bool: True if subreddit is valid and accessible
         """
+        key = subreddit_name.lower()
+        cached = _VALID_CACHE.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[1] < _VALID_CACHE_TTL:
+                return cached[0]
+            del _VALID_CACHE[key]
+
         try:
             subreddit = await self.reddit.subreddit(subreddit_name)
             # Load the subreddit to trigger any errors
             await subreddit.load()
             logger.info(f"Subreddit r/{subreddit_name} validated successfully")
+            _cache_validation(key, True)
             return True
 
         except Exception as e:
@@ -58,9 +92,11 @@ class AsyncRedditClient:
             # Check for common error patterns
             if 'not found' in error_str or 'subreddit' in error_str or '404' in error_str:
                 logger.warning(f"Invalid subreddit: r/{subreddit_name}")
+                _cache_validation(key, False)
                 return False
             elif 'forbidden' in error_str or 'private' in error_str or '403' in error_str:
                 logger.warning(f"Subreddit r/{subreddit_name} is private or banned")
+                _cache_validation(key, False)
                 return False
             else:
                 logger.error(f"Error validating subreddit r/{subreddit_name}: {e}")
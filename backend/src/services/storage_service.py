@@ -3,6 +3,7 @@ Storage Service Module
 Handles saving and loading Reddit posts to/from JSON files
 """
 
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -13,6 +14,11 @@ from src.config.settings import config
 from src.utils.loggers import get_logger
 from src.models.reddit_post import RedditPost, PostCollection
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = get_logger(__name__)
 
 
@@ -25,6 +31,9 @@ class StorageService:
         self.processed_data_path = Path(config.DATA_PROCESSED_PATH)
         self.audio_data_path = Path(config.DATA_AUDIO_PATH)
 
+        # SHA-256 of the bytes last written by save_post_collection, per path
+        self._saved_digests: Dict[str, str] = {}
+
         # Ensure directories exist
         self._ensure_directories()
 
@@ -121,8 +130,16 @@ class StorageService:
         filepath = self.processed_data_path / filename
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(collection.to_json())
+            if orjson is not None:
+                # Compact output; orjson encodes the RedditPost dataclasses
+                # natively, so no per-post to_dict() is built
+                data = orjson.dumps(collection.posts)
+            else:
+                data = collection.to_json().encode('utf-8')
+
+            with open(filepath, 'wb') as f:
+                f.write(data)
+            self._saved_digests[str(filepath)] = hashlib.sha256(data).hexdigest()
 
             logger.success(
                 f"Saved collection with {len(collection.posts)} posts to {filepath}")
@@ -132,6 +149,30 @@ class StorageService:
             logger.error(f"Error saving collection to {filepath}: {e}")
             raise
 
+    def verify_saved_collection(self, filepath: str) -> bool:
+        """
+        Check a file written by save_post_collection without parsing it
+
+        Args:
+            filepath: Path returned by save_post_collection
+
+        Returns:
+            True if the file's SHA-256 matches the bytes that were written
+        """
+        expected = self._saved_digests.get(str(filepath))
+        if expected is None:
+            logger.warning(f"No recorded digest for {filepath}")
+            return False
+
+        try:
+            with open(filepath, 'rb') as f:
+                actual = hashlib.file_digest(f, 'sha256').hexdigest()
+        except OSError as e:
+            logger.error(f"Error reading {filepath}: {e}")
+            return False
+
+        return actual == expected
+
     def load_post_collection(self, filename: str) -> Optional[PostCollection]:
         """
         Load a PostCollection from JSON file
@@ -148,10 +189,15 @@ class StorageService:
 
             if filepath.exists():
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        json_str = f.read()
-
-                    collection = PostCollection.from_json(json_str)
+                    if orjson is not None:
+                        with open(filepath, 'rb') as f:
+                            data = orjson.loads(f.read())
+                        collection = PostCollection(
+                            RedditPost.from_dict(item) for item in data)
+                    else:
+                        with open(filepath, 'r', encoding='utf-8') as f:
+                            json_str = f.read()
+                        collection = PostCollection.from_json(json_str)
                     logger.info(
                         f"Loaded collection with {len(collection.posts)} posts from {filepath}")
                     return collection
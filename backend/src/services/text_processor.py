@@ -9,6 +9,40 @@ from src.utils.loggers import get_logger
 
 logger = get_logger(__name__)
 
+# Flags for entries of TextProcessor.patterns that are matched case-insensitively
+_PATTERN_FLAGS = {
+    'gold_thanks': re.IGNORECASE,
+    'rip_inbox': re.IGNORECASE,
+    'this_blew_up': re.IGNORECASE,
+    'throwaway': re.IGNORECASE,
+    'tldr': re.IGNORECASE,
+}
+
+# Fixed patterns used by the cleaning steps, compiled once at import
+_QUOTE_MARKER = re.compile(r'^>+\s*')
+_BOLD_STARS = re.compile(r'\*{2,}([^\*]+)\*{2,}')
+_ITALIC_STAR = re.compile(r'\*([^\*]+)\*')
+_BOLD_UNDERSCORES = re.compile(r'_{2,}([^_]+)_{2,}')
+_ITALIC_UNDERSCORE = re.compile(r'_([^_]+)_')
+_USER_SLASH_MENTION = re.compile(r'/u/([\w-]+)', re.IGNORECASE)
+_USER_MENTION = re.compile(r'u/([\w-]+)', re.IGNORECASE)
+_SUBREDDIT_SLASH_MENTION = re.compile(r'/r/([\w-]+)', re.IGNORECASE)
+_SUBREDDIT_MENTION = re.compile(r'(?<!\/)r\/([\w-]+)', re.IGNORECASE)
+_REMOVED_MARKER = re.compile(r'\[removed\]')
+_DELETED_MARKER = re.compile(r'\[deleted\]')
+_MODERATOR_REMOVED_MARKER = re.compile(r'\[removed by moderator\]')
+_EMPHATIC_TITLE_END = re.compile(r'[!?]{2,}$')
+_ZERO_WIDTH_CHARS = re.compile(r'[\u200b\u200c\u200d\ufeff]')
+_MISSING_SENTENCE_SPACE = re.compile(r'([.!?])([A-Z])')
+
+
+def _age_gender_replacement(match: re.Match) -> str:
+    """Turn an age/gender match like [28M] into '28 year old male'"""
+    age = match.group(1)
+    gender = match.group(2).upper()
+    gender_full = "male" if gender == 'M' else "female"
+    return f"{age} year old {gender_full}"
+
 
 class TextProcessor:
     """Main text processing service for Reddit posts"""
@@ -80,6 +114,22 @@ class TextProcessor:
             }
         }
 
+        # Compile the patterns once; the cleaning steps call Pattern.sub directly
+        self.compiled = {
+            name: re.compile(pattern, _PATTERN_FLAGS.get(name, 0))
+            for name, pattern in self.patterns.items()
+            if isinstance(pattern, str)
+        }
+
+        # All abbreviations (and their lowercase forms) in one alternation,
+        # so expanding them is a single scan instead of two per abbreviation
+        abbreviations = self.patterns['abbreviations']
+        self._abbreviation_expansions = dict(abbreviations)
+        self._abbreviation_expansions.update(
+            (abbr.lower(), expansion.lower()) for abbr, expansion in abbreviations.items())
+        self._abbreviation_re = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, self._abbreviation_expansions)) + r')\b')
+
         logger.info("Text processor initialized with Reddit-specific patterns")
 
     def process_post(self, post: Dict[str, Any], options: Optional[Dict] = None) -> Dict[str, Any]:
@@ -179,24 +229,20 @@ class TextProcessor:
     def _remove_reddit_cliches(self, text: str) -> str:
         """Remove common Reddit cliches and phrases"""
         # Remove "Thanks for the gold" type phrases
-        text = re.sub(self.patterns['gold_thanks'],
-                      '', text, flags=re.IGNORECASE)
-        text = re.sub(self.patterns['rip_inbox'],
-                      '', text, flags=re.IGNORECASE)
-        text = re.sub(self.patterns['this_blew_up'],
-                      '', text, flags=re.IGNORECASE)
-        text = re.sub(self.patterns['throwaway'],
-                      '', text, flags=re.IGNORECASE)
+        text = self.compiled['gold_thanks'].sub('', text)
+        text = self.compiled['rip_inbox'].sub('', text)
+        text = self.compiled['this_blew_up'].sub('', text)
+        text = self.compiled['throwaway'].sub('', text)
 
         return text
 
     def _process_markdown(self, text: str) -> str:
         """Process Reddit markdown formatting"""
         # Remove strikethrough
-        text = re.sub(self.patterns['strikethrough'], r'\1', text)
+        text = self.compiled['strikethrough'].sub(r'\1', text)
 
         # Reveal spoilers
-        text = re.sub(self.patterns['spoiler'], r'\1', text)
+        text = self.compiled['spoiler'].sub(r'\1', text)
 
         # Process quotes (remove > marker)
         lines = text.split('\n')
@@ -204,78 +250,64 @@ class TextProcessor:
         for line in lines:
             if line.strip().startswith('>'):
                 # Remove quote marker but keep the text
-                processed_lines.append(re.sub(r'^>+\s*', '', line))
+                processed_lines.append(_QUOTE_MARKER.sub('', line))
             else:
                 processed_lines.append(line)
         text = '\n'.join(processed_lines)
 
         # Bold and italic markers
-        text = re.sub(r'\*{2,}([^\*]+)\*{2,}', r'\1', text)  # Bold
-        text = re.sub(r'\*([^\*]+)\*', r'\1', text)  # Italic
-        text = re.sub(r'_{2,}([^_]+)_{2,}', r'\1', text)  # Bold
-        text = re.sub(r'_([^_]+)_', r'\1', text)  # Italic
+        text = _BOLD_STARS.sub(r'\1', text)  # Bold
+        text = _ITALIC_STAR.sub(r'\1', text)  # Italic
+        text = _BOLD_UNDERSCORES.sub(r'\1', text)  # Bold
+        text = _ITALIC_UNDERSCORE.sub(r'\1', text)  # Italic
 
         return text
 
     def _process_mentions(self, text: str) -> str:
         """Process user and subreddit mentions"""
         # Convert /u/username to "user username"
-        text = re.sub(r'/u/([\w-]+)', r'user \1', text, flags=re.IGNORECASE)
-        text = re.sub(r'u/([\w-]+)', r'user \1', text, flags=re.IGNORECASE)
+        text = _USER_SLASH_MENTION.sub(r'user \1', text)
+        text = _USER_MENTION.sub(r'user \1', text)
 
         # Convert /r/subreddit to "subreddit r/subreddit"
-        text = re.sub(r'/r/([\w-]+)', r'subreddit \1',
-                      text, flags=re.IGNORECASE)
-        text = re.sub(r'(?<!\/)r\/([\w-]+)',
-                      r'subreddit \1', text, flags=re.IGNORECASE)
+        text = _SUBREDDIT_SLASH_MENTION.sub(r'subreddit \1', text)
+        text = _SUBREDDIT_MENTION.sub(r'subreddit \1', text)
 
         return text
 
     def _process_links(self, text: str) -> str:
         """Process links and URLs"""
         # Reddit-style links [text](url) - keep just the text
-        text = re.sub(self.patterns['reddit_link'], r'\1', text)
+        text = self.compiled['reddit_link'].sub(r'\1', text)
 
         # Remove standalone URLs
-        text = re.sub(self.patterns['url'], 'link removed', text)
-        text = re.sub(self.patterns['www_url'], 'link removed', text)
+        text = self.compiled['url'].sub('link removed', text)
+        text = self.compiled['www_url'].sub('link removed', text)
 
         return text
 
     def _expand_abbreviations(self, text: str) -> str:
         """Expand common Reddit abbreviations"""
-        for abbr, expansion in self.patterns['abbreviations'].items():
-            # Case-sensitive replacement for acronyms
-            text = re.sub(r'\b' + abbr + r'\b', expansion, text)
-            # Also handle lowercase versions
-            text = re.sub(r'\b' + abbr.lower() + r'\b',
-                          expansion.lower(), text)
-
-        return text
+        # Case-sensitive match on the acronym, plus its lowercase version
+        return self._abbreviation_re.sub(
+            lambda match: self._abbreviation_expansions[match.group()], text)
 
     def _process_metadata(self, text: str) -> str:
         """Process age/gender and other metadata markers"""
         # Convert [28M] to "28 year old male"
-        def age_gender_replacement(match):
-            age = match.group(1)
-            gender = match.group(2).upper()
-            gender_full = "male" if gender == 'M' else "female"
-            return f"{age} year old {gender_full}"
-
-        text = re.sub(self.patterns['age_gender'],
-                      age_gender_replacement, text)
+        text = self.compiled['age_gender'].sub(_age_gender_replacement, text)
 
         # Remove other brackets that might contain metadata
-        text = re.sub(r'\[removed\]', '', text)
-        text = re.sub(r'\[deleted\]', '', text)
-        text = re.sub(r'\[removed by moderator\]', '', text)
+        text = _REMOVED_MARKER.sub('', text)
+        text = _DELETED_MARKER.sub('', text)
+        text = _MODERATOR_REMOVED_MARKER.sub('', text)
 
         return text
 
     def _process_title(self, text: str) -> str:
         """Special processing for titles"""
         # Remove trailing punctuation if it's just for emphasis
-        text = re.sub(r'[!?]{2,}$', '?', text)
+        text = _EMPHATIC_TITLE_END.sub('?', text)
 
         # Ensure title ends with appropriate punctuation
         if text and text[-1] not in '.!?':
@@ -286,20 +318,19 @@ class TextProcessor:
     def _clean_spacing(self, text: str) -> str:
         """Clean up spacing and newlines"""
         # Remove emojis
-        text = re.sub(self.patterns['emoji'], '', text)
+        text = self.compiled['emoji'].sub('', text)
 
         # Clean up EDIT markers
-        text = re.sub(self.patterns['edit_marker'], '\n\nEdit: ', text)
+        text = self.compiled['edit_marker'].sub('\n\nEdit: ', text)
 
         # Clean up TL;DR
-        text = re.sub(
-            self.patterns['tldr'], '\n\nToo long, didn\'t read: ', text, flags=re.IGNORECASE)
+        text = self.compiled['tldr'].sub('\n\nToo long, didn\'t read: ', text)
 
         # Replace multiple spaces with single space
-        text = re.sub(self.patterns['multiple_spaces'], ' ', text)
+        text = self.compiled['multiple_spaces'].sub(' ', text)
 
         # Replace multiple newlines with double newline
-        text = re.sub(self.patterns['multiple_newlines'], '\n\n', text)
+        text = self.compiled['multiple_newlines'].sub('\n\n', text)
 
         return text
 
@@ -309,11 +340,10 @@ class TextProcessor:
         text = text.strip()
 
         # Remove any remaining special characters that might cause issues
-        text = re.sub(r'[\u200b\u200c\u200d\ufeff]',
-                      '', text)  # Zero-width spaces
+        text = _ZERO_WIDTH_CHARS.sub('', text)  # Zero-width spaces
 
         # Ensure sentences are properly spaced
-        text = re.sub(r'([.!?])([A-Z])', r'\1 \2', text)
+        text = _MISSING_SENTENCE_SPACE.sub(r'\1 \2', text)
 
         return text
 
@@ -4,7 +4,7 @@ Abstract TTS engine that can swap between different providers
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import os
 from pathlib import Path
 from gtts import gTTS
@@ -57,6 +57,22 @@ class TTSEngine(ABC):
         """Check if text is valid for TTS"""
         pass
 
+    def resolve_voice_settings(
+        self,
+        voice: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve requested voice/language to what generate_audio would record
+
+        Engines that apply defaults override this so callers can compare a
+        request against stored metadata.
+
+        Returns:
+            Tuple of (voice, language) as they appear in generation metadata
+        """
+        return voice, language
+
 
 class GTTSEngine(TTSEngine):
     """Google Text-to-Speech engine implementation"""
@@ -77,6 +93,23 @@ class GTTSEngine(TTSEngine):
         }
         
         logger.info(f"gTTS engine initialized with language={self.language}, tld={self.tld}")
+
+    def resolve_voice_settings(
+        self,
+        voice: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve voice/language the way generate_audio does
+
+        The language comes from the override, then the voice's configured
+        language, then the engine default; a missing voice is recorded as
+        '<lang>-default'.
+        """
+        from src.config.settings import config
+        voice_config = config.TTSConfig.GTTS_VOICES.get(voice, {})
+        lang = language or voice_config.get('language', self.language)
+        return voice or f'{lang}-default', lang
     def _adjust_audio_speed(
         self,
         audio_path: str,
@@ -192,7 +225,7 @@ class GTTSEngine(TTSEngine):
             voice_config = config.TTSConfig.GTTS_VOICES.get(voice, {})
 
             # Determine language and TLD
-            lang = language or voice_config.get('language', self.language)
+            voice_name, lang = self.resolve_voice_settings(voice, language)
             tld = voice_config.get('tld', self.tld)
 
             # Validate and clamp speed
@@ -234,7 +267,7 @@ class GTTSEngine(TTSEngine):
                 'success': True,
                 'file_path': output_path,
                 'duration_seconds': duration,
-                'voice': voice or f'{lang}-default',
+                'voice': voice_name,
                 'language': lang,
                 'speed': speed,
                 'file_size_bytes': file_size,
@@ -333,6 +366,14 @@ class ReplicateKokoroEngine(TTSEngine):
             'error': 'Not implemented yet - will be available in cloud deployment'
         }
     
+    def resolve_voice_settings(
+        self,
+        voice: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve voice to the Kokoro default"""
+        return voice or 'af_bella', language
+
     def get_available_voices(self) -> List[Dict[str, str]]:
         """Get available Kokoro voices"""
         voices = []
@@ -371,6 +412,7 @@ class MockTTSEngine(TTSEngine):
     def __init__(self, config: Optional[Dict] = None):
         """Initialize mock engine"""
         self.config = config or {}
+        self.language = self.config.get('language', 'en')
         logger.info("Mock TTS engine initialized (for testing)")
     
     def generate_audio(
@@ -387,9 +429,11 @@ class MockTTSEngine(TTSEngine):
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         Path(output_path).touch()
         
+        voice_name, language = self.resolve_voice_settings(voice, kwargs.get('language'))
         return {
             'engine': 'mock',
-            'voice': voice or 'mock_voice',
+            'voice': voice_name,
+            'language': language,
             'file_path': output_path,
             'duration_seconds': self.estimate_duration(text, speed),
             'text_length': len(text),
@@ -397,6 +441,14 @@ class MockTTSEngine(TTSEngine):
             'mock': True
         }
     
+    def resolve_voice_settings(
+        self,
+        voice: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve voice/language to the mock defaults"""
+        return voice or 'mock_voice', language or self.language
+
     def get_available_voices(self) -> List[Dict[str, str]]:
         """Get mock voices"""
         return [
@@ -40,5 +40,14 @@ def get_logger(name: str):
     return logger.bind(module=name)
 
 
+_BANNER = "=" * 60
+
+
+def log_banner(title: str, level: str = "INFO"):
+    """Log a title between two rule lines as a single record"""
+    # depth=1 so the record names the caller, not this helper
+    logger.opt(depth=1).log(level, f"\n{_BANNER}\n{title}\n{_BANNER}")
+
+
 # Export the main logger
-__all__ = ['logger', 'get_logger']
+__all__ = ['logger', 'get_logger', 'log_banner']
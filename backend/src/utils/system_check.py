@@ -5,6 +5,7 @@ This module provides utilities to check if required system dependencies
 are installed and available for TTS features like speed adjustment.
 """
 
+import shutil
 import subprocess
 import logging
 from typing import Dict
@@ -16,11 +17,16 @@ def check_ffmpeg_installed() -> bool:
     """
     Check if ffmpeg is installed and available.
 
-    ffmpeg is required for audio speed adjustment via pydub.
+    ffmpeg is required for audio speed adjustment via pydub, which only
+    looks on PATH. Returns False without spawning a subprocess when
+    ``ffmpeg`` is not on PATH at all.
 
     Returns:
         True if ffmpeg is available, False otherwise
     """
+    if shutil.which('ffmpeg') is None:
+        return False
+
     try:
         result = subprocess.run(
             ['ffmpeg', '-version'],
@@ -97,15 +103,21 @@ def log_tts_capabilities():
     Log TTS system capabilities at startup.
 
     This provides visibility into which TTS features are available
-    based on installed dependencies.
+    based on installed dependencies. Skips the dependency probes entirely
+    when neither INFO nor WARNING messages would be emitted.
     """
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    if not info_enabled and not logger.isEnabledFor(logging.WARNING):
+        return
+
     caps = get_tts_capabilities()
 
-    logger.info("TTS System Capabilities:")
-    logger.info(f"  - gTTS: {'✓' if caps['gtts_available'] else '✗'}")
-    logger.info(f"  - Speed Adjustment: {'✓' if caps['speed_adjustment'] else '✗'}")
-    logger.info(f"  - ffmpeg: {'✓' if caps['ffmpeg_installed'] else '✗'}")
-    logger.info(f"  - pydub: {'✓' if caps['pydub_available'] else '✗'}")
+    if info_enabled:
+        logger.info("TTS System Capabilities:")
+        logger.info(f"  - gTTS: {'✓' if caps['gtts_available'] else '✗'}")
+        logger.info(f"  - Speed Adjustment: {'✓' if caps['speed_adjustment'] else '✗'}")
+        logger.info(f"  - ffmpeg: {'✓' if caps['ffmpeg_installed'] else '✗'}")
+        logger.info(f"  - pydub: {'✓' if caps['pydub_available'] else '✗'}")
 
     if not caps['speed_adjustment']:
         logger.warning(
@@ -5,11 +5,55 @@ Common functions for text manipulation and analysis
 
 import re
 import unicodedata
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 from src.utils.loggers import get_logger
 
 logger = get_logger(__name__)
 
+# Sentence boundary: a run of terminal punctuation followed by whitespace
+# or the end of the text
+_SENTENCE_ENDERS = re.compile(r'[.!?]+(?=\s|$)')
+
+# Split point between sentences: the whitespace after terminal punctuation.
+# The lookbehind keeps the punctuation on its sentence
+_SENTENCE_BREAKS = re.compile(r'(?<=[.!?])\s+')
+
+
+# Filename cleanup: characters to drop, and runs to collapse into "_"
+_FILENAME_UNSAFE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATORS = re.compile(r'[-\s]+')
+
+# One alternation for all TTS markers so add_tts_markers scans the text once:
+# pauses after punctuation, pauses before edit markers, emphasis on quotes
+_TTS_MARKERS = re.compile(
+    r'(?P<punct>[.!?])\s+|(?P<edit>Edit:|Update:|Note:)|"(?P<quote>[^"]+)"')
+
+
+def _tts_marker_replacement(match: re.Match) -> str:
+    """Build the markup for whichever _TTS_MARKERS branch matched"""
+    if match.group('punct'):
+        return f'{match.group("punct")} <break time="0.5s"/> '
+    if match.group('edit'):
+        return f'<break time="1s"/> {match.group("edit")}'
+    return f'<emphasis level="moderate">{match.group("quote")}</emphasis>'
+
+
+def _iter_paragraphs(text: str) -> Iterator[str]:
+    """
+    Lazily yield paragraphs separated by blank lines
+
+    Yields the same pieces as splitting on blank lines, without building
+    the intermediate list.
+    """
+    pos = 0
+    while True:
+        nxt = text.find('\n\n', pos)
+        if nxt == -1:
+            yield text[pos:]
+            return
+        yield text[pos:nxt]
+        pos = nxt + 2
+
 
 class TextHelpers:
     """Helper functions for text processing"""
@@ -45,37 +89,72 @@ class TextHelpers:
         if len(text) <= max_chars:
             return [text]
 
+        # No paragraph or sentence boundaries at all: fall back to fixed
+        # windows instead of emitting one oversized "sentence"
+        if '\n\n' not in text and not _SENTENCE_ENDERS.search(text):
+            stripped = text.strip()
+            if len(stripped) <= max_chars:
+                return [stripped] if stripped else []
+            return TextHelpers._split_fixed_windows(stripped, max_chars)
+
         chunks = []
-        paragraphs = text.split('\n\n')
-        current_chunk = ""
+        # Collect fragments and join once per chunk instead of growing a
+        # string with += (which re-copies the whole buffer every time)
+        current_parts: List[str] = []
+        current_len = 0
 
-        for paragraph in paragraphs:
+        for paragraph in _iter_paragraphs(text):
             # If single paragraph is too long, split by sentences
             if len(paragraph) > max_chars:
                 sentences = TextHelpers.split_into_sentences(paragraph)
+                if len(sentences) == 1 and len(sentences[0]) > max_chars:
+                    # Unsplittable paragraph: flush and hard-wrap it
+                    if current_parts:
+                        chunks.append(''.join(current_parts).strip())
+                        current_parts = []
+                        current_len = 0
+                    chunks.extend(
+                        TextHelpers._split_fixed_windows(sentences[0], max_chars))
+                    continue
                 for sentence in sentences:
-                    if len(current_chunk) + len(sentence) + 2 <= max_chars:
-                        current_chunk += sentence + " "
+                    if current_len + len(sentence) + 2 <= max_chars:
+                        current_parts.append(sentence)
+                        current_parts.append(" ")
+                        current_len += len(sentence) + 1
                     else:
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                        current_chunk = sentence + " "
+                        if current_parts:
+                            chunks.append(''.join(current_parts).strip())
+                        current_parts = [sentence, " "]
+                        current_len = len(sentence) + 1
             else:
                 # Add paragraph to current chunk if it fits
-                if len(current_chunk) + len(paragraph) + 2 <= max_chars:
-                    current_chunk += paragraph + "\n\n"
+                if current_len + len(paragraph) + 2 <= max_chars:
+                    current_parts.append(paragraph)
+                    current_parts.append("\n\n")
+                    current_len += len(paragraph) + 2
                 else:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = paragraph + "\n\n"
+                    if current_parts:
+                        chunks.append(''.join(current_parts).strip())
+                    current_parts = [paragraph, "\n\n"]
+                    current_len = len(paragraph) + 2
 
         # Add remaining chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_parts:
+            chunks.append(''.join(current_parts).strip())
 
         logger.debug(f"Split text into {len(chunks)} chunks")
         return chunks
 
+    @staticmethod
+    def _split_fixed_windows(text: str, max_chars: int) -> List[str]:
+        """Slice text into consecutive windows of at most max_chars
+
+        Windows are stripped like every other chunk, and whitespace-only
+        windows are dropped.
+        """
+        windows = (text[i:i + max_chars].strip() for i in range(0, len(text), max_chars))
+        return [w for w in windows if w]
+
     @staticmethod
     def split_into_sentences(text: str) -> List[str]:
         """
@@ -87,20 +166,9 @@ class TextHelpers:
         Returns:
             List of sentences
         """
-        # Simple sentence splitting (can be improved)
-        sentence_enders = re.compile(r'([.!?])\s+')
-        sentences = sentence_enders.split(text)
-
-        # Recombine the sentence enders with their sentences
-        result = []
-        for i in range(0, len(sentences), 2):
-            if i + 1 < len(sentences):
-                result.append(sentences[i] + sentences[i + 1])
-            else:
-                if sentences[i].strip():
-                    result.append(sentences[i])
-
-        return [s.strip() for s in result if s.strip()]
+        # The split itself runs in C, and the punctuation is already
+        # attached, so only stripping and dropping empties is left
+        return [s for s in (part.strip() for part in _SENTENCE_BREAKS.split(text)) if s]
 
     @staticmethod
     def normalize_unicode(text: str) -> str:
@@ -144,17 +212,21 @@ class TextHelpers:
         Returns:
             Dictionary of statistics
         """
+        # Tokenize once and derive every count from these results
         words = text.split()
-        sentences = TextHelpers.split_into_sentences(text)
+        word_count = len(words)
+        sentence_count = len(TextHelpers.split_into_sentences(text))
 
         return {
             'character_count': len(text),
-            'word_count': len(words),
-            'sentence_count': len(sentences),
-            'average_word_length': sum(len(word) for word in words) / len(words) if words else 0,
-            'average_sentence_length': len(words) / len(sentences) if sentences else 0,
-            'estimated_reading_time': TextHelpers.estimate_reading_time(text),
-            'paragraph_count': len([p for p in text.split('\n\n') if p.strip()])
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            # join() sums the word lengths in C rather than a per-word generator
+            'average_word_length': len(''.join(words)) / word_count if words else 0,
+            'average_sentence_length': word_count / sentence_count if sentence_count else 0,
+            # Same math as estimate_reading_time() at 150 wpm, without re-splitting
+            'estimated_reading_time': (word_count / 150) * 60,
+            'paragraph_count': sum(1 for p in _iter_paragraphs(text) if p.strip())
         }
 
     @staticmethod
@@ -191,13 +263,27 @@ class TextHelpers:
             hints.append('contains_dialogue')
 
         # Check for all caps (shouting)
-        words = text.split()
-        caps_words = [w for w in words if w.isupper() and len(w) > 1]
-        if len(caps_words) > len(words) * 0.1:  # More than 10% caps
+        caps_count, word_count = TextHelpers._count_caps_words(text)
+        if caps_count > word_count * 0.1:  # More than 10% caps
             hints.append('contains_shouting')
 
         return hints
 
+    @staticmethod
+    def _count_caps_words(text: str) -> Tuple[int, int]:
+        """
+        Count all-caps words (longer than one character) and total words
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Tuple of (caps_word_count, word_count)
+        """
+        words = text.split()
+        caps_count = sum(1 for w in words if len(w) > 1 and w.isupper())
+        return caps_count, len(words)
+
     @staticmethod
     def clean_for_filename(text: str, max_length: int = 50) -> str:
         """
@@ -211,16 +297,12 @@ class TextHelpers:
             Filename-safe text
         """
         # Remove special characters
-        text = re.sub(r'[^\w\s-]', '', text)
+        text = _FILENAME_UNSAFE.sub('', text)
         # Replace spaces with underscores
-        text = re.sub(r'[-\s]+', '_', text)
-        # Truncate to max length
-        if len(text) > max_length:
-            text = text[:max_length]
-        # Remove trailing underscore
-        text = text.rstrip('_')
-
-        return text.lower()
+        text = _FILENAME_SEPARATORS.sub('_', text)
+        # Truncate to max length and remove trailing underscore before
+        # lowercasing, so lower() only touches what is kept
+        return text[:max_length].rstrip('_').lower()
 
     @staticmethod
     def add_tts_markers(text: str) -> str:
@@ -233,17 +315,7 @@ class TextHelpers:
         Returns:
             Text with TTS markers
         """
-        # Add pauses after certain punctuation
-        text = re.sub(r'([.!?])\s+', r'\1 <break time="0.5s"/> ', text)
-
-        # Add pauses before "Edit:" and similar markers
-        text = re.sub(r'(Edit:|Update:|Note:)', r'<break time="1s"/> \1', text)
-
-        # Add emphasis to quoted text
-        text = re.sub(
-            r'"([^"]+)"', r'<emphasis level="moderate">\1</emphasis>', text)
-
-        return text
+        return _TTS_MARKERS.sub(_tts_marker_replacement, text)
 
     @staticmethod
     def remove_tts_unsafe_chars(text: str) -> str:
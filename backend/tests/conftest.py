@@ -3,38 +3,48 @@ Pytest fixtures for Reddit Audio Feed tests
 Provides reusable test data and mocked services
 """
 
+import asyncio
+import inspect
+import types
 import pytest
+from contextlib import contextmanager
 from unittest.mock import Mock, MagicMock
 from datetime import datetime
 
 
+# Timestamp and post template are built once at import; fixtures hand out copies
+_NOW_ISO = datetime.now().isoformat()
+
+_POST_TEMPLATE = {
+    'id': 'test123',
+    'title': 'Test Post: This is a sample Reddit post',
+    'selftext': 'This is the body text of the test post. It contains enough content to test TTS generation.',
+    'subreddit': 'test',
+    'author': 'testuser',
+    'created_utc': _NOW_ISO,
+    'fetched_at': _NOW_ISO,
+    'score': 100,
+    'upvote_ratio': 0.95,
+    'num_comments': 25,
+    'total_awards_received': 2,
+    'permalink': '/r/test/comments/test123/test_post',
+    'url': 'https://reddit.com/r/test/comments/test123',
+    'is_self': True,
+    'is_video': False,
+    'over_18': False,
+    'spoiler': False,
+    'stickied': False,
+    'locked': False,
+    'link_flair_text': None,
+    'author_flair_text': None,
+    'content_categories': None
+}
+
+
 @pytest.fixture
 def mock_reddit_post():
     """Single mock Reddit post for testing"""
-    return {
-        'id': 'test123',
-        'title': 'Test Post: This is a sample Reddit post',
-        'selftext': 'This is the body text of the test post. It contains enough content to test TTS generation.',
-        'subreddit': 'test',
-        'author': 'testuser',
-        'created_utc': datetime.now().isoformat(),
-        'fetched_at': datetime.now().isoformat(),
-        'score': 100,
-        'upvote_ratio': 0.95,
-        'num_comments': 25,
-        'total_awards_received': 2,
-        'permalink': '/r/test/comments/test123/test_post',
-        'url': 'https://reddit.com/r/test/comments/test123',
-        'is_self': True,
-        'is_video': False,
-        'over_18': False,
-        'spoiler': False,
-        'stickied': False,
-        'locked': False,
-        'link_flair_text': None,
-        'author_flair_text': None,
-        'content_categories': None
-    }
+    return _POST_TEMPLATE.copy()
 
 
 @pytest.fixture
@@ -58,9 +68,97 @@ def posts(mock_reddit_post):
     return [post1, post2, post3]
 
 
+class _BlockingRedditClient:
+    """Blocking view of AsyncRedditClient for the synchronous tests
+
+    Every coroutine method runs to completion on one event loop, so the
+    asyncpraw session stays bound to the loop it was created on.
+    """
+
+    def __init__(self, client, loop):
+        self._client = client
+        self._loop = loop
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        return lambda *args, **kwargs: self._loop.run_until_complete(attr(*args, **kwargs))
+
+
+@contextmanager
+def blocking_reddit_client():
+    """Open the shared Reddit client on a private event loop and close both afterwards"""
+    from src.services import reddit_service
+
+    loop = asyncio.new_event_loop()
+    try:
+        client = loop.run_until_complete(reddit_service.get_reddit_client())
+        try:
+            yield _BlockingRedditClient(client, loop)
+        finally:
+            loop.run_until_complete(client.close())
+            # The singleton's session died with this loop; let the next caller build a new one
+            reddit_service._reddit_client = None
+    finally:
+        loop.close()
+
+
+@pytest.fixture(scope="session")
+def reddit():
+    """Reddit client shared by every test in the session, skipped without credentials"""
+    from src.config.settings import config
+    if not (config.REDDIT_CLIENT_ID and config.REDDIT_CLIENT_SECRET and config.REDDIT_USER_AGENT):
+        pytest.skip("Reddit API credentials are not configured")
+    with blocking_reddit_client() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sample_python_posts(reddit):
+    """Hot r/python posts, fetched once and shared by every test that needs real data"""
+    posts = reddit.fetch_subreddit_posts("python", "hot", 5)
+    # fetch_subreddit_posts reports failures as a dict with an empty 'posts' list
+    if not isinstance(posts, list) or not posts:
+        pytest.skip("Could not fetch r/python posts from Reddit")
+    return posts
+
+
+@pytest.fixture(scope="session")
+def audio_gen(shared_gtts_session):
+    """gTTS audio generator shared by every test in the session, on the pooled gTTS session"""
+    from src.services.audio_generator import get_audio_generator
+    return get_audio_generator('gtts')
+
+
+@pytest.fixture(scope="session")
+def storage():
+    """Storage service shared by every test in the session"""
+    from src.services.storage_service import get_storage_service
+    return get_storage_service()
+
+
 @pytest.fixture
-def client(monkeypatch):
-    """Mock Reddit client that doesn't make real API calls"""
+def data_dirs(tmp_path, monkeypatch):
+    """Point every config data directory at a fresh tmp_path for this test"""
+    from src.config.settings import config
+    monkeypatch.setattr(config, 'DATA_DIR', tmp_path)
+    for name in ('raw', 'processed', 'audio'):
+        (tmp_path / name).mkdir()
+        monkeypatch.setattr(config, f'DATA_{name.upper()}_PATH', tmp_path / name)
+    return tmp_path
+
+
+@pytest.fixture
+def mock_audio_gen(data_dirs):
+    """AudioGenerator on the mock TTS engine, writing under data_dirs"""
+    from src.services.audio_generator import AudioGenerator
+    return AudioGenerator('mock')
+
+
+@pytest.fixture(scope="session")
+def _mock_reddit_client():
+    """Mock Reddit client that doesn't make real API calls, built once per session"""
     # Create mock client
     mock_client = Mock()
 
@@ -87,8 +185,8 @@ def client(monkeypatch):
                 'selftext': f'This is mock content for post {i}.',
                 'subreddit': subreddit_name,
                 'author': f'mockuser{i}',
-                'created_utc': datetime.now().isoformat(),
-                'fetched_at': datetime.now().isoformat(),
+                'created_utc': _NOW_ISO,
+                'fetched_at': _NOW_ISO,
                 'score': 100 + i * 10,
                 'upvote_ratio': 0.95,
                 'num_comments': 25 + i,
@@ -113,7 +211,7 @@ def client(monkeypatch):
             'selftext': f'Mock content for post {post_id}',
             'subreddit': 'test',
             'author': 'mockuser',
-            'created_utc': datetime.now().isoformat(),
+            'created_utc': _NOW_ISO,
             'score': 100,
             'num_comments': 25,
             'is_self': True
@@ -121,7 +219,51 @@ def client(monkeypatch):
 
     mock_client.get_post_content = mock_get_post_content
 
-    # Monkeypatch the get_reddit_client function to return our mock
-    monkeypatch.setattr('src.services.reddit_service.get_reddit_client', lambda: mock_client)
-
     return mock_client
+
+
+@pytest.fixture
+def client(_mock_reddit_client, monkeypatch):
+    """Mock Reddit client, patched in as get_reddit_client for this test only"""
+    monkeypatch.setattr('src.services.reddit_service.get_reddit_client',
+                        lambda: _mock_reddit_client)
+    return _mock_reddit_client
+
+
+@pytest.fixture(scope="session")
+def shared_gtts_session():
+    """Route every gTTS request through one pooled requests.Session
+
+    gTTS opens (and closes) a new session per request, paying a fresh TLS
+    handshake each time; sharing one keeps connections alive across posts
+    and threads. Not autouse: only ``audio_gen`` and tests that reach gTTS
+    through another service request it, so offline runs never import gTTS.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        import gtts.tts as gtts_tts
+    except ImportError:  # gTTS is optional; without it there is nothing to patch
+        yield None
+        return
+
+    class _KeepAliveSession(requests.Session):
+        """Session that survives gTTS's ``with requests.Session()`` block"""
+
+        def __exit__(self, *args):
+            pass
+
+    session = _KeepAliveSession()
+    session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+    # gTTS only uses requests.Session, requests.Request and the exception
+    # classes, so hand it a copy of the module with Session swapped out
+    requests_shim = types.ModuleType('requests')
+    requests_shim.__dict__.update(vars(requests))
+    requests_shim.Session = lambda: session
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(gtts_tts, 'requests', requests_shim)
+        yield session
+
+    requests.Session.close(session)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Debug text processing pipeline to see what's being sent to TTS"""
 
+import re
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -11,6 +12,10 @@ from src.services.content_filter import get_content_filter
 from src.services.tts_preprocessor import get_tts_preprocessor
 from src.utils.loggers import logger
 
+# Reddit artifacts that should never reach TTS, matched in a single scan
+REDDIT_ARTIFACT_PATTERNS = ['[', ']', '(', ')', 'http', 'www', '/r/', '/u/', 'edit:', 'Edit:']
+REDDIT_ARTIFACTS_RE = re.compile('|'.join(map(re.escape, REDDIT_ARTIFACT_PATTERNS)))
+
 
 def debug_text_pipeline():
     """Debug each step of text processing"""
@@ -72,7 +77,6 @@ def debug_text_pipeline():
     # Check for SSML tags
     if '<' in final_text and '>' in final_text:
         logger.warning("⚠️ SSML tags found in text - gTTS doesn't support these!")
-        import re
         tags = re.findall(r'<[^>]+>', final_text)
         logger.info(f"Tags found: {tags[:5]}")
     
@@ -82,21 +86,23 @@ def debug_text_pipeline():
         logger.warning(f"⚠️ Special Unicode characters found: {set(special_chars)}")
     
     # Check for Reddit artifacts
-    reddit_patterns = ['[', ']', '(', ')', 'http', 'www', '/r/', '/u/', 'edit:', 'Edit:']
-    for pattern in reddit_patterns:
-        if pattern in final_text:
+    found = set(REDDIT_ARTIFACTS_RE.findall(final_text))
+    for pattern in REDDIT_ARTIFACT_PATTERNS:
+        if pattern in found:
             logger.warning(f"⚠️ Reddit artifact found: '{pattern}'")
     
     # Save the text for inspection
     debug_file = Path('debug_tts_text.txt')
     with open(debug_file, 'w', encoding='utf-8') as f:
-        f.write("RAW REDDIT TITLE:\n")
-        f.write(post['title'] + "\n\n")
-        f.write("RAW REDDIT BODY:\n")
-        f.write(post.get('selftext', 'NO BODY') + "\n\n")
-        f.write("="*50 + "\n")
-        f.write("FINAL TEXT SENT TO TTS:\n")
-        f.write(final_text)
+        f.write("".join([
+            "RAW REDDIT TITLE:\n",
+            post['title'] + "\n\n",
+            "RAW REDDIT BODY:\n",
+            post.get('selftext', 'NO BODY') + "\n\n",
+            "="*50 + "\n",
+            "FINAL TEXT SENT TO TTS:\n",
+            final_text,
+        ]))
     
     logger.info(f"\n💾 Full text saved to: {debug_file}")
     
@@ -5,11 +5,10 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.services.audio_generator import get_audio_generator
 from src.utils.loggers import logger
 
 
-def test_fixed_audio():
+def test_fixed_audio(audio_gen):
     """Test audio generation with problematic text"""
     
     test_post = {
@@ -24,8 +23,7 @@ def test_fixed_audio():
     logger.info("Testing fixed audio generation...")
     
     # Generate audio
-    generator = get_audio_generator('gtts')
-    result = generator.generate_from_post(test_post, force_regenerate=True)
+    result = audio_gen.generate_from_post(test_post, force_regenerate=True, skip_unchanged=True)
     
     if result.get('success'):
         logger.success(f"✅ Audio generated: {result['filename']}")
@@ -35,4 +33,5 @@ def test_fixed_audio():
 
 
 if __name__ == "__main__":
-    test_fixed_audio()
+    from src.services.audio_generator import get_audio_generator
+    test_fixed_audio(get_audio_generator('gtts'))
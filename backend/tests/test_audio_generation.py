@@ -2,42 +2,43 @@
 """Test audio generation functionality"""
 
 import sys
+import threading
+import time
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.services.audio_generator import get_audio_generator
+import pytest
+
 from src.services.reddit_service import get_reddit_client
 from src.utils.loggers import logger
 
 
-def test_tts_engines():
+def test_tts_engines(audio_gen):
     """Test different TTS engines"""
     logger.info("="*60)
     logger.info("Testing TTS Engines")
     logger.info("="*60)
     
     # Test gTTS engine
-    generator = get_audio_generator('gtts')
-    
     # Get available voices
-    voices = generator.engine.get_available_voices()
+    voices = audio_gen.engine.get_available_voices()
     logger.info(f"\nAvailable voices: {len(voices)}")
     for voice in voices[:3]:
         logger.info(f"  - {voice['id']}: {voice['name']}")
     
     # Test text validation
     test_text = "Hello, this is a test of the audio generation system."
-    is_valid = generator.engine.validate_text(test_text)
+    is_valid = audio_gen.engine.validate_text(test_text)
     logger.info(f"\nText validation: {'✅ Valid' if is_valid else '❌ Invalid'}")
     
     # Estimate duration
-    duration = generator.engine.estimate_duration(test_text)
+    duration = audio_gen.engine.estimate_duration(test_text)
     logger.info(f"Estimated duration: {duration:.1f} seconds")
 
     assert True  # Test completed successfully
 
 
-def test_single_post_audio():
+def test_single_post_audio(audio_gen):
     """Test generating audio from a single post"""
     logger.info("\n" + "="*60)
     logger.info("Testing Single Post Audio Generation")
@@ -56,8 +57,7 @@ def test_single_post_audio():
     }
     
     # Generate audio
-    generator = get_audio_generator('gtts')
-    result = generator.generate_from_post(test_post, voice='en-US', speed=1.0)
+    result = audio_gen.generate_from_post(test_post, voice='en-US', speed=1.0)
     
     if result.get('success'):
         logger.success(f"✅ Audio generated successfully!")
@@ -70,7 +70,88 @@ def test_single_post_audio():
     assert result.get('success'), f"Audio generation failed: {result.get('error')}"
 
 
-def test_real_reddit_audio():
+def test_skip_unchanged_reuses_matching_audio(mock_audio_gen, mock_reddit_post):
+    """skip_unchanged reuses audio only for the same text and settings"""
+    engine_calls = []
+    generate_audio = mock_audio_gen.engine.generate_audio
+    mock_audio_gen.engine.generate_audio = (
+        lambda **kwargs: engine_calls.append(kwargs) or generate_audio(**kwargs))
+
+    first = mock_audio_gen.generate_from_post(mock_reddit_post, force_regenerate=True)
+    assert first['success']
+
+    reused = mock_audio_gen.generate_from_post(
+        mock_reddit_post, force_regenerate=True, skip_unchanged=True)
+    assert reused['filename'] == first['filename']
+    assert len(engine_calls) == 1
+
+    # The result is a copy; annotating it must not touch stored metadata
+    reused['subreddit'] = 'edited'
+    assert mock_audio_gen.metadata[mock_reddit_post['id']]['subreddit'] == 'test'
+
+    # A language override is a different rendering, so it is regenerated
+    mock_audio_gen.generate_from_post(
+        mock_reddit_post, language='fr', force_regenerate=True, skip_unchanged=True)
+    assert len(engine_calls) == 2
+
+    # ...and going back to the default language must not reuse the French clip
+    mock_audio_gen.generate_from_post(
+        mock_reddit_post, force_regenerate=True, skip_unchanged=True)
+    assert len(engine_calls) == 3
+
+    # Likewise for voices: a default-voice request doesn't reuse another voice
+    mock_audio_gen.generate_from_post(
+        mock_reddit_post, voice='other_voice', force_regenerate=True, skip_unchanged=True)
+    mock_audio_gen.generate_from_post(
+        mock_reddit_post, force_regenerate=True, skip_unchanged=True)
+    assert len(engine_calls) == 5
+
+    # Spelling out the defaults matches audio made without them
+    mock_audio_gen.generate_from_post(
+        mock_reddit_post, voice='mock_voice', language='en',
+        force_regenerate=True, skip_unchanged=True)
+    assert len(engine_calls) == 5
+
+
+def test_generate_stream_yields_in_order(mock_audio_gen, posts):
+    """generate_stream yields one result per post, in input order"""
+    results = list(mock_audio_gen.generate_stream(posts, force_regenerate=True))
+    assert [r['post_id'] for r in results] == [p['id'] for p in posts]
+    assert all(r['success'] for r in results)
+
+
+def test_generate_stream_reraises_producer_errors(mock_audio_gen, posts, monkeypatch):
+    """An exception raised while generating surfaces in the consumer"""
+    generate = mock_audio_gen.generate_from_post
+
+    def flaky(post, *args):
+        if post['id'] == posts[1]['id']:
+            raise RuntimeError('boom')
+        return generate(post, *args)
+
+    monkeypatch.setattr(mock_audio_gen, 'generate_from_post', flaky)
+    stream = mock_audio_gen.generate_stream(posts, force_regenerate=True)
+    assert next(stream)['post_id'] == posts[0]['id']
+    with pytest.raises(RuntimeError, match='boom'):
+        next(stream)
+
+
+def test_generate_stream_stops_when_caller_exits_early(mock_audio_gen, posts):
+    """Closing the stream early stops the producer instead of leaving it blocked"""
+    many_posts = [dict(posts[0], id=f'early{i}') for i in range(10)]
+    threads_before = threading.active_count()
+    stream = mock_audio_gen.generate_stream(many_posts, force_regenerate=True, prefetch=1)
+    assert next(stream)['post_id'] == 'early0'
+    stream.close()
+
+    deadline = time.monotonic() + 5
+    while threading.active_count() > threads_before and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert threading.active_count() == threads_before
+    assert len(mock_audio_gen.metadata) < len(many_posts)
+
+
+def test_real_reddit_audio(audio_gen):
     """Test with real Reddit posts"""
     logger.info("\n" + "="*60)
     logger.info("Testing with Real Reddit Posts")
@@ -84,9 +165,8 @@ def test_real_reddit_audio():
         logger.warning("No posts fetched from Reddit")
         return False
     
-    # Generate audio for posts
-    generator = get_audio_generator('gtts')
-    results = generator.generate_batch(posts, voice='en-US', speed=1.0)
+    # Generate audio for posts, reporting each one while the next is synthesized
+    results = audio_gen.generate_stream(posts, voice='en-US', speed=1.0)
     
     # Show results
     for i, result in enumerate(results, 1):
@@ -96,7 +176,7 @@ def test_real_reddit_audio():
             logger.error(f"❌ Post {i}: {result.get('reason', result.get('error', 'Unknown error'))}")
     
     # Show statistics
-    stats = generator.get_audio_stats()
+    stats = audio_gen.get_audio_stats()
     logger.info(f"\nAudio Generation Statistics:")
     logger.info(f"  Total files: {stats['total_audio_files']}")
     logger.info(f"  Total duration: {stats.get('total_duration_minutes', 0):.1f} minutes")
@@ -113,15 +193,18 @@ def test_real_reddit_audio():
 def main():
     """Run all audio generation tests"""
     logger.info("Starting Audio Generation Tests")
+    # Imported here so collecting this module doesn't load gTTS
+    from src.services.audio_generator import get_audio_generator
+    generator = get_audio_generator('gtts')
     
     # Test TTS engines
-    test_tts_engines()
+    test_tts_engines(generator)
     
     # Test single post
-    test_single_post_audio()
+    test_single_post_audio(generator)
     
     # Test with real Reddit posts
-    test_real_reddit_audio()
+    test_real_reddit_audio(generator)
     
     logger.success("\n✅ All audio generation tests completed!")
     logger.info("\n📁 Check backend/data/audio/ for generated MP3 files")
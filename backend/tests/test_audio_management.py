@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
 """Test audio management and queue system"""
 
+import json
+import pytest
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.services.audio_manager import get_audio_manager
-from src.services.audio_queue import get_audio_queue
+from src.services.audio_manager import AudioManager, get_audio_manager
 from src.utils.loggers import logger
 
 
+def count_m3u_tracks(path) -> int:
+    """Count track entries in an M3U playlist, skipping comments and blank lines"""
+    # Stream the bytes; the first byte alone decides whether a line is a track
+    with open(path, 'rb') as f:
+        return sum(1 for line in f if line[:1] not in (b'#', b'\n', b'\r', b''))
+
+
 def test_audio_manager():
     """Test audio file management"""
     logger.info("="*60)
@@ -38,12 +46,15 @@ def test_audio_manager():
     assert True  # Test completed successfully
 
 
+@pytest.mark.usefixtures("shared_gtts_session")
 def test_audio_queue():
     """Test audio queue system"""
     logger.info("\n" + "="*60)
     logger.info("Testing Audio Queue")
     logger.info("="*60)
     
+    # audio_queue pulls in audio_generator and gTTS; only this test needs it
+    from src.services.audio_queue import get_audio_queue
     queue = get_audio_queue()
     
     # Get queue statistics
@@ -69,6 +80,69 @@ def test_audio_queue():
     assert True  # Test completed successfully
 
 
+def test_add_posts_bulk(data_dirs, posts, monkeypatch):
+    """add_posts_bulk queues every post with score-based priority in one save"""
+    from src.services.audio_queue import AudioQueue
+    queue = AudioQueue()
+
+    saves = []
+    save_queue = queue._save_queue
+    monkeypatch.setattr(queue, '_save_queue', lambda: saves.append(1) or save_queue())
+
+    scored = [dict(post, score=score) for post, score in zip(posts, (50, 550, 5000))]
+    queue_ids = queue.add_posts_bulk(scored)
+
+    assert len(saves) == 1
+    assert [queue.queue[qid]['post_id'] for qid in queue_ids] == [p['id'] for p in posts]
+    # score // 100, clamped to 1-10
+    assert [queue.queue[qid]['priority'] for qid in queue_ids] == [1, 5, 10]
+    assert all(queue.queue[qid]['status'] == 'pending' for qid in queue_ids)
+
+    # Persisted to the queue file under DATA_DIR
+    assert set(AudioQueue().queue) == set(queue_ids)
+
+    # An empty batch adds nothing and skips the save
+    assert queue.add_posts_bulk([]) == []
+    assert len(saves) == 1
+
+
+def test_refresh_metadata_rereads_only_changed_file(data_dirs, monkeypatch):
+    """AudioManager re-parses audio_metadata.json only after it changes on disk"""
+    metadata_file = data_dirs / 'audio' / 'audio_metadata.json'
+    metadata_file.write_text(json.dumps({'a': {'subreddit': 'python'}}))
+
+    # Count parses of the metadata file; audio_manager calls json.load on it
+    reads = []
+    real_load = json.load
+
+    def counting_load(f, *args, **kwargs):
+        if Path(f.name) == metadata_file:
+            reads.append(f.name)
+        return real_load(f, *args, **kwargs)
+
+    monkeypatch.setattr(json, 'load', counting_load)
+
+    manager = AudioManager()
+    assert [f['post_id'] for f in manager.get_audio_by_subreddit('python')] == ['a']
+    assert len(reads) == 1
+
+    # Unchanged (st_mtime_ns, st_size) stamp: served from memory, not re-read
+    assert [f['post_id'] for f in manager.get_audio_by_subreddit('python')] == ['a']
+    assert manager.get_recent_audio(hours=24) == []
+    assert len(reads) == 1
+
+    # Rewritten file: picked up on the next call
+    metadata_file.write_text(json.dumps(
+        {'a': {'subreddit': 'python'}, 'b': {'subreddit': 'python'}}))
+    assert sorted(f['post_id'] for f in manager.get_audio_by_subreddit('python')) == ['a', 'b']
+    assert len(reads) == 2
+
+    # Deleted file: metadata is cleared without another parse
+    metadata_file.unlink()
+    assert manager.get_audio_by_subreddit('python') == []
+    assert len(reads) == 2
+
+
 def test_playlist_creation():
     """Test playlist creation"""
     logger.info("\n" + "="*60)
@@ -86,9 +160,8 @@ def test_playlist_creation():
         logger.success(f"✅ Created playlist: {playlist_path}")
         
         # Show playlist contents
-        with open(playlist_path, 'r') as f:
-            lines = f.readlines()
-            logger.info(f"Playlist has {len([l for l in lines if not l.startswith('#')])} tracks")
+        track_count = count_m3u_tracks(playlist_path)
+        logger.info(f"Playlist has {track_count} tracks")
     else:
         logger.warning("No recent audio files for playlist")
 
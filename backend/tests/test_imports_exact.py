@@ -1,13 +1,7 @@
 #!/usr/bin/env python3
 import sys
-from pathlib import Path
-
-# Add backend directory to Python path
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
 
 print(f"Python: {sys.executable}")
-print(f"Path added: {backend_dir}")
 
 # Now try imports
 try:
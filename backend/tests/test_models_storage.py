@@ -3,13 +3,11 @@
 Test Reddit Post Models and Storage Service
 """
 
+import pytest
+
 from src.utils.loggers import logger
-from src.services.reddit_service import get_reddit_client
 from src.services.storage_service import get_storage_service
 from src.models.reddit_post import RedditPost, PostCollection
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def test_models():
@@ -45,21 +43,56 @@ def test_models():
     assert True  # Test completed successfully
 
 
-def test_storage_with_real_data():
+def test_from_trusted_dict_matches_from_dict(mock_reddit_post):
+    """from_trusted_dict builds the same post as from_dict for service output"""
+    data = dict(mock_reddit_post, unexpected_key='dropped')
+    trusted = RedditPost.from_trusted_dict(data)
+    assert trusted == RedditPost.from_dict(data)
+    assert not hasattr(trusted, 'unexpected_key')
+    assert 'unexpected_key' in data  # the input dict is left untouched
+
+    # Missing optional fields fall back to their dataclass defaults
+    minimal = {k: mock_reddit_post[k]
+               for k in ('id', 'title', 'subreddit', 'created_utc', 'fetched_at')}
+    trusted = RedditPost.from_trusted_dict(minimal)
+    assert trusted == RedditPost.from_dict(minimal)
+    assert trusted.to_dict() == RedditPost(**minimal).to_dict()
+    assert trusted.has_text_content is False
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_verify_saved_collection(data_dirs, posts, monkeypatch, use_orjson):
+    """verify_saved_collection matches written bytes and spots later edits"""
+    from src.services import storage_service
+    if use_orjson and storage_service.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(storage_service, 'orjson', None)
+
+    storage = storage_service.StorageService()
+    collection = PostCollection(RedditPost.from_trusted_dict(p) for p in posts)
+    filepath = storage.save_post_collection(collection, "verify_test.json")
+
+    assert storage.verify_saved_collection(filepath)
+    loaded = storage.load_post_collection("verify_test.json")
+    assert [p.to_dict() for p in loaded.posts] == [p.to_dict() for p in collection.posts]
+
+    with open(filepath, 'ab') as f:
+        f.write(b' ')
+    assert not storage.verify_saved_collection(filepath)
+
+    # Files this service didn't write have no digest to compare against
+    assert not storage.verify_saved_collection(str(data_dirs / 'processed' / 'other.json'))
+
+
+def test_storage_with_real_data(sample_python_posts, storage):
     """Test storage with real Reddit data"""
     logger.info("\n" + "="*50)
     logger.info("Testing Storage with Real Data...")
 
-    # Get Reddit client and fetch some posts
-    reddit = get_reddit_client()
-    posts_data = reddit.fetch_subreddit_posts("python", "hot", 5)
-
     # Convert to RedditPost objects
-    posts = [RedditPost.from_dict(post_data) for post_data in posts_data]
-    collection = PostCollection(posts)
-
-    # Get storage service
-    storage = get_storage_service()
+    collection = PostCollection(
+        RedditPost.from_trusted_dict(post_data) for post_data in sample_python_posts)
 
     # Test saving collection
     filepath = storage.save_post_collection(collection, "test_collection.json")
@@ -102,7 +135,10 @@ def main():
     test_models()
 
     # Test storage with real data
-    test_storage_with_real_data()
+    from conftest import blocking_reddit_client
+    with blocking_reddit_client() as reddit:
+        posts = reddit.fetch_subreddit_posts("python", "hot", 5)
+    test_storage_with_real_data(posts, get_storage_service())
 
     logger.success("\n✅ All tests completed successfully!")
 
@@ -5,18 +5,25 @@ Test Reddit Service functionality
 
 import pytest
 from src.utils.loggers import logger
-from src.services.reddit_service import get_reddit_client
 from pprint import pprint
 import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the backend directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def test_reddit_connection():
     """Test basic Reddit connection"""
+    # Imported lazily so collecting this module doesn't load the Reddit client stack
+    from src.services.reddit_service import get_reddit_client
+
     logger.info("Testing Reddit connection...")
     try:
         client = get_reddit_client()
@@ -98,15 +105,23 @@ def test_save_to_json(posts):
 
     try:
         filename = "data/raw/test_posts.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(posts, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(posts, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(posts, f, indent=2, ensure_ascii=False)
 
         logger.success(f"✅ Saved {len(posts)} posts to {filename}")
 
         # Verify file was created
-        with open(filename, 'r', encoding='utf-8') as f:
-            loaded_posts = json.load(f)
-            logger.info(f"Verified: File contains {len(loaded_posts)} posts")
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                loaded_posts = orjson.loads(f.read())
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                loaded_posts = json.load(f)
+        logger.info(f"Verified: File contains {len(loaded_posts)} posts")
 
     except Exception as e:
         logger.error(f"❌ Error saving posts to JSON: {e}")
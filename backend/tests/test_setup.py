@@ -3,16 +3,12 @@
 
 import pytest
 from src.utils.loggers import logger, get_logger
-from src.config.settings import Config
-import sys
-from pathlib import Path
-
-# Add the backend directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def test_config(monkeypatch):
     """Test configuration loading"""
+    from src.config.settings import Config
+
     logger.info("Testing configuration...")
 
     # Patch Config CLASS attributes (not instance)
@@ -1,21 +1,16 @@
 #!/usr/bin/env python3
 """Test text processing functionality"""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from src.services.text_processor import get_text_processor
-from src.services.reddit_service import get_reddit_client
 from src.utils.text_helper import TextHelpers, extract_statistics
-from src.utils.loggers import logger
+from src.utils.loggers import logger, log_banner
 
 
 def test_reddit_text_cleaning():
     """Test cleaning of Reddit-specific text"""
-    logger.info("="*60)
-    logger.info("Testing Reddit Text Cleaning")
-    logger.info("="*60)
+    log_banner("Testing Reddit Text Cleaning")
     
     processor = get_text_processor()
     
@@ -39,18 +34,40 @@ def test_reddit_text_cleaning():
     assert True  # Test completed successfully
 
 
-def test_with_real_posts():
+def test_split_into_chunks_strips_hard_wrapped_windows():
+    """Hard-wrapped text yields stripped, non-empty chunks"""
+    # Fits once trailing whitespace is dropped
+    assert TextHelpers.split_into_chunks('hello world ', 11) == ['hello world']
+
+    # No sentence or paragraph boundaries: fixed windows, no blank tail
+    assert TextHelpers.split_into_chunks('a' * 25 + '   ', 10) == [
+        'a' * 10, 'a' * 10, 'a' * 5]
+
+    # A paragraph that fits after stripping is merged, not hard-wrapped
+    assert TextHelpers.split_into_chunks(' \nword  !   \n\n!\n\n\nx ?', 11) == [
+        'word  ! !', 'x ?']
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("", (0, 0)),
+    ("   ", (0, 0)),
+    ("THIS IS SHOUTING and this is not", (3, 7)),
+    ("I am OK, A1 and 42 are fine; U.S.A. counts", (3, 10)),
+    ("\tTABS\nAND\x1cUNIT\x1fSEPARATORS  x ", (4, 5)),
+    ("MiXeD CaSe WORDS!!! ?? ..", (1, 5)),
+])
+def test_count_caps_words(text, expected):
+    """All-caps words longer than one character are counted against all words"""
+    assert TextHelpers._count_caps_words(text) == expected
+
+
+def test_with_real_posts(sample_python_posts):
     """Test with real Reddit posts"""
-    logger.info("\n" + "="*60)
-    logger.info("Testing with Real Reddit Posts")
-    logger.info("="*60)
+    log_banner("Testing with Real Reddit Posts")
     
-    reddit = get_reddit_client()
     processor = get_text_processor()
     
-    posts = reddit.fetch_subreddit_posts("python", "hot", 2)
-    
-    for post in posts[:1]:  # Just test first post
+    for post in sample_python_posts[:1]:  # Just test first post
         processed = processor.process_post(post)
         logger.info(f"Original: {post['title'][:80]}")
         logger.info(f"Cleaned:  {processed['processed_title'][:80]}")
@@ -64,7 +81,9 @@ def test_with_real_posts():
 def main():
     logger.info("Starting Text Processing Tests")
     test_reddit_text_cleaning()
-    test_with_real_posts()
+    from conftest import blocking_reddit_client
+    with blocking_reddit_client() as reddit:
+        test_with_real_posts(reddit.fetch_subreddit_posts("python", "hot", 5))
     logger.success("\n✅ All tests completed!")
 
 
@@ -1,30 +1,17 @@
 #!/usr/bin/env python3
-print("Testing imports...")
-
-try:
-    import praw
-    print("✓ praw imported successfully")
-except ImportError as e:
-    print(f"✗ praw import failed: {e}")
-
-try:
-    import dotenv
-    print("✓ dotenv imported successfully")
-except ImportError as e:
-    print(f"✗ dotenv import failed: {e}")
+import importlib.util
+import sys
 
-try:
-    import loguru
-    print("✓ loguru imported successfully")
-except ImportError as e:
-    print(f"✗ loguru import failed: {e}")
+print("Testing imports...")
 
-try:
-    import requests
-    print("✓ requests imported successfully")
-except ImportError as e:
-    print(f"✗ requests import failed: {e}")
+# find_spec only locates each package, so this is a presence check that
+# skips running praw/loguru module bodies; test_imports_exact.py does the
+# real imports
+for name in ("praw", "dotenv", "loguru", "requests"):
+    if importlib.util.find_spec(name) is not None:
+        print(f"✓ {name} found")
+    else:
+        print(f"✗ {name} not found")
 
-import sys
 print(f"\nPython executable: {sys.executable}")
 print(f"Python version: {sys.version}")